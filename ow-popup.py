@@ -2,30 +2,41 @@
 
 import json
 import os
-import stat
-import subprocess
 import sys
+import time
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from itertools import islice
 
 try:
     import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
 except ModuleNotFoundError:
     print("You need to install python-requests package", file=sys.stderr)
     sys.exit(1)
 
-from tools import (
+from tools_core import (
     check_key,
+    create_background_task,
     eprint,
-    file_age,
     hms,
+    json_loads,
     load_json,
-    save_json,
+    load_json_cached,
+    save_bytes,
     temp_dir,
 )
 
 dir_name = os.path.dirname(__file__)
 
+# Number of 3-hour forecast entries displayed in the popup
+forecast_count = 32
+
+# (connect, read) timeouts for OpenWeather API calls, in seconds
+timeout = (3.05, 10)
+
 degrees = {"standard": "°K", "metric": "°C", "imperial": "°F"}
 
 icons = {
@@ -98,85 +109,145 @@ def get_icon(id):
     return icons.get(id, "✨")
 
 
+directions = ("N", "NE", "E", "SE", "S", "SW", "W", "NW")
+
+
 def direction(deg):
-    if 0 <= deg <= 23 or 337 <= deg <= 360:
-        return "N"
-    elif 24 <= deg <= 68:
-        return "NE"
-    elif 69 <= deg <= 113:
-        return "E"
-    elif 114 <= deg <= 158:
-        return "SE"
-    elif 159 <= deg <= 203:
-        return "S"
-    elif 204 <= deg <= 248:
-        return "SW"
-    elif 249 <= deg <= 293:
-        return "W"
-    elif 293 <= deg <= 336:
-        return "NW"
-    else:
-        return "WTF"
+    return directions[int((deg % 360 + 22.5) // 45) % 8]
 
 
 def join(*args: str, sep: str = " "):
     return sep.join(filter(lambda _: _, args))
 
 
+def _sys_time(data, name: str, icon: str) -> str:
+    if value := data.get("sys", {}).get(name):
+        return f"{icon} {datetime.fromtimestamp(value):%H:%M}"
+
+
+def _main_value(data, name: str):
+    return data.get("main", {}).get(name)
+
+
+def _weather_value(data, name: str):
+    return (data.get("weather") or [{}])[0].get(name)
+
+
+def _wind_value(data, name: str):
+    return data.get("wind", {}).get(name)
+
+
+def _country(data) -> str:
+    if value := data.get("sys", {}).get("country"):
+        return f"{value}"
+
+
+def _fmt_icon(value) -> str:
+    if value is not None:
+        return get_icon(value)
+
+
+def _fmt_desc(value) -> str:
+    if value is not None:
+        return value.capitalize()
+
+
+def _fmt_humidity(value) -> str:
+    if value:
+        return f"{value}%"
+
+
+def _fmt_pressure(value) -> str:
+    if value:
+        return f"{value} hPa"
+
+
+def _fmt_speed(value) -> str:
+    if value is not None:
+        return f"{value} m/s"
+
+
+def _fmt_direction(value) -> str:
+    if value is not None:
+        return direction(value)
+
+
+def _fmt_clouds(value) -> str:
+    if value is not None:
+        return f"{value}%"
+
+
+def _fmt_visibility(value) -> str:
+    if value is not None:
+        return f"{int(value / 1000)} km"
+
+
+# Property name -> extractor, each returning a falsy value when missing
+ow_properties = {
+    "country": _country,
+    "sunrise": lambda data: _sys_time(data, "sunrise", "🌅"),
+    "sunset": lambda data: _sys_time(data, "sunset", "🌇"),
+    "icon": lambda data: _fmt_icon(_weather_value(data, "id")),
+    "desc": lambda data: _fmt_desc(_weather_value(data, "description")),
+    "temp": lambda data: _main_value(data, "temp"),
+    "feels_like": lambda data: _main_value(data, "feels_like"),
+    "humidity": lambda data: _fmt_humidity(_main_value(data, "humidity")),
+    "pressure": lambda data: _fmt_pressure(_main_value(data, "pressure")),
+    "wind_speed": lambda data: _fmt_speed(_wind_value(data, "speed")),
+    "wind_dir": lambda data: _fmt_direction(_wind_value(data, "deg")),
+    "wind_gust": lambda data: _fmt_speed(_wind_value(data, "gust")),
+    "clouds": lambda data: _fmt_clouds(data.get("clouds", {}).get("all")),
+    "visibility": lambda data: _fmt_visibility(data.get("visibility")),
+}
+
+
 def get_ow_property(data, name: str) -> str:
-    match name:
-        case "country":
-            if name in data["sys"] and data["sys"][name]:
-                return "{}".format(data["sys"][name])
-        case "sunrise":
-            if name in data["sys"] and data["sys"][name]:
-                dt = datetime.fromtimestamp(data["sys"][name])
-                return f'🌅 {dt.strftime("%H:%M")}'
-        case "sunset":
-            if name in data["sys"] and data["sys"][name]:
-                dt = datetime.fromtimestamp(data["sys"][name])
-                return f'🌇 {dt.strftime("%H:%M")}'
-        case "icon":
-            if "id" in data["weather"][0]:
-                return get_icon(data["weather"][0]["id"])
-        case "desc":
-            if "description" in data["weather"][0]:
-                return data["weather"][0]["description"].capitalize()
-        case "temp":
-            if name in data["main"] and (value := data["main"][name]):
-                return value
-        case "feels_like":
-            if name in data["main"] and (value := data["main"][name]):
-                return value
-        case "humidity":
-            if name in data["main"] and (value := data["main"][name]):
-                return "{}%".format(value)
-        case "pressure":
-            if name in data["main"] and (value := data["main"][name]):
-                return "{} hPa".format(value)
-        case "wind_speed":
-            if "wind" in data and "speed" in data["wind"]:
-                return "{} m/s".format(data["wind"]["speed"])
-        case "wind_dir":
-            if "wind" in data and "deg" in data["wind"]:
-                return "{}".format((direction(data["wind"]["deg"])))
-        case "wind_gust":
-            if "wind" in data and "gust" in data["wind"]:
-                return "{} m/s".format(data["wind"]["gust"])
-        case "clouds":
-            if name in data and "all" in data[name]:
-                return "{}%".format(data[name]["all"])
-        case "visibility":
-            if name in data:
-                return "{} km".format(int(data[name] / 1000))
+    if (handler := ow_properties.get(name)) and (value := handler(data)):
+        return value
     return ""
 
 
-def calling_funcname() -> str:
-    return sys._getframe().f_back.f_code.co_name
+def extract_entry(
+    data,
+    *,
+    humidity: bool = False,
+    wind: bool = False,
+    pressure: bool = False,
+    cloudiness: bool = False,
+    visibility: bool = False,
+) -> dict:
+    """
+    Extracts the fields of a forecast entry, optional ones only when enabled
+    """
+    entry = {}
+    main = data.get("main", {})
+    if weather := (data.get("weather") or [{}])[0]:
+        entry["icon"] = _fmt_icon(weather.get("id")) or ""
+        entry["desc"] = _fmt_desc(weather.get("description")) or ""
+    entry["temp"] = main.get("temp")
+    entry["feels_like"] = main.get("feels_like")
+    if humidity and (value := _fmt_humidity(main.get("humidity"))):
+        entry["humidity"] = value
+    if wind and (values := data.get("wind")):
+        if value := _fmt_speed(values.get("speed")):
+            entry["wind_speed"] = value
+        if value := _fmt_direction(values.get("deg")):
+            entry["wind_dir"] = value
+        if value := _fmt_speed(values.get("gust")):
+            entry["wind_gust"] = value
+    if pressure and (value := _fmt_pressure(main.get("pressure"))):
+        entry["pressure"] = value
+    if cloudiness and (value := _fmt_clouds(data.get("clouds", {}).get("all"))):
+        entry["clouds"] = value
+    if visibility and (value := _fmt_visibility(data.get("visibility"))):
+        entry["visibility"] = value
+    return entry
 
 
 class OpenWeather:
+    weather_url = "https://api.openweathermap.org/data/2.5/weather"
+    forecast_url = "https://api.openweathermap.org/data/2.5/forecast"
+
     def __init__(self, settings, voc):
         defaults = {
             "appid": "",
@@ -207,6 +278,9 @@ class OpenWeather:
 
         self.weather = None
         self.forecast = None
+        # os.stat results of the cache files, valid for one refresh cycle only
+        self._weather_stat = None
+        self._forecast_stat = None
 
         tmp_dir = temp_dir()
         self.weather_file = "{}-{}".format(
@@ -227,62 +301,127 @@ class OpenWeather:
         eprint("Latitude: {}".format(settings["lat"]))
         eprint("Longitude: {}".format(settings["long"]))
 
-        self.weather_request = "https://api.openweathermap.org/data/2.5/weather?lat={}&lon={}&units={}&lang={}&appid={}".format(
-            settings["lat"],
-            settings["long"],
-            settings["units"],
-            settings["lang"],
-            settings["appid"],
-        )
+        if not settings["appid"]:
+            eprint("API key not set, using cached data only")
 
-        self.forecast_request = "https://api.openweathermap.org/data/2.5/forecast?lat={}&lon={}&units={}&lang={}&appid={}".format(
-            settings["lat"],
-            settings["long"],
-            settings["units"],
-            settings["lang"],
-            settings["appid"],
+        params = {
+            "lat": settings["lat"],
+            "lon": settings["long"],
+            "units": settings["units"],
+            "lang": settings["lang"],
+            "appid": settings["appid"],
+        }
+        self.weather_params = params
+        self.forecast_params = params | {"cnt": forecast_count}
+        # ETags of the cached responses, to revalidate them with the API
+        self._weather_etag = None
+        self._forecast_etag = None
+
+        # Keep-alive session shared by weather and forecast requests
+        self.http = requests.Session()
+        self.http.mount(
+            "https://",
+            HTTPAdapter(
+                pool_connections=2,
+                pool_maxsize=4,
+                max_retries=Retry(total=2, backoff_factor=0.3),
+            ),
         )
+        self.http.headers.update({"User-Agent": "ow-waybar"})
 
         self.id = 800
         self.label = ""
         self.popup = ""
+        # Weather, forecast and voc dicts the current popup was rendered from
+        self._popup_data = None
+
+    @staticmethod
+    def _stat(path):
+        try:
+            return os.stat(path)
+        except FileNotFoundError:
+            return None
+
+    def _is_expired(self, st) -> bool:
+        return st is None or time.time() - st.st_mtime > self.settings["interval"] - 1
+
+    def _request(self, url, params, etag):
+        headers = {"If-None-Match": etag} if etag else {}
+        return self.http.get(url, params=params, headers=headers, timeout=timeout)
 
     def get_data(self):
-        self.get_weather()
-        self.get_forecast()
+        self._weather_stat = self._stat(self.weather_file)
+        self._forecast_stat = self._stat(self.forecast_file)
+        # Both requests are independent, fire them concurrently
+        with ThreadPoolExecutor(max_workers=2) as ex:
+            futures = [ex.submit(self.get_weather), ex.submit(self.get_forecast)]
+            for future in futures:
+                future.result()
         self.update_widget()
 
     def get_weather(self):
-        if not os.path.isfile(self.weather_file) or int(
-            file_age(self.weather_file) > self.settings["interval"] - 1
-        ):
+        if self.settings["appid"] and self._is_expired(self._weather_stat):
             eprint(hms(), "Requesting weather data")
             try:
-                r = requests.get(self.weather_request)
-                self.weather = json.loads(r.text)
+                # Only revalidate when there is a cache file to fall back on
+                etag = self._weather_etag if self._weather_stat is not None else None
+                r = self._request(self.weather_url, self.weather_params, etag)
+                if r.status_code == 304:
+                    try:
+                        # Cached data is still current, reset its age
+                        os.utime(self.weather_file)
+                    except FileNotFoundError:
+                        # Cache file removed meanwhile, request it again
+                        self._weather_etag = None
+                        r = self._request(self.weather_url, self.weather_params, None)
+                    else:
+                        self._weather_stat = self._stat(self.weather_file)
+                        if not self.weather:
+                            self.weather = load_json(self.weather_file)
+                        return
+                self.weather = json_loads(r.content)
                 if self.weather["cod"] in ["200", 200]:
-                    save_json(self.weather, self.weather_file)
+                    save_bytes(r.content, self.weather_file)
+                    self._weather_stat = self._stat(self.weather_file)
+                    self._weather_etag = r.headers.get("ETag")
             except Exception as e:
                 self.weather = None
                 eprint(e)
-        elif not self.weather:
+        elif not self.weather and self._weather_stat is not None:
             eprint(hms(), "Loading weather data from file")
             self.weather = load_json(self.weather_file)
 
     def get_forecast(self):
-        if not os.path.isfile(self.forecast_file) or int(
-            file_age(self.forecast_file) > self.settings["interval"] - 1
-        ):
+        if self.settings["appid"] and self._is_expired(self._forecast_stat):
             eprint(hms(), "Requesting forecast data")
             try:
-                r = requests.get(self.forecast_request)
-                self.forecast = json.loads(r.text)
+                # Only revalidate when there is a cache file to fall back on
+                etag = self._forecast_etag if self._forecast_stat is not None else None
+                r = self._request(self.forecast_url, self.forecast_params, etag)
+                if r.status_code == 304:
+                    try:
+                        # Cached data is still current, reset its age
+                        os.utime(self.forecast_file)
+                    except FileNotFoundError:
+                        # Cache file removed meanwhile, request it again
+                        self._forecast_etag = None
+                        r = self._request(self.forecast_url, self.forecast_params, None)
+                    else:
+                        self._forecast_stat = self._stat(self.forecast_file)
+                        # The popup shows the forecast file mtime
+                        self._popup_data = None
+                        if not self.forecast:
+                            self.forecast = load_json(self.forecast_file)
+                        return
+                self.forecast = json_loads(r.content)
                 if self.forecast["cod"] in ["200", 200]:
-                    save_json(self.forecast, self.forecast_file)
+                    save_bytes(r.content, self.forecast_file)
+                    self._forecast_stat = self._stat(self.forecast_file)
+                    self._forecast_etag = r.headers.get("ETag")
             except Exception as e:
                 self.forecast = None
                 eprint(e)
-        elif not self.forecast:
+        elif not self.forecast and self._forecast_stat is not None:
             eprint(hms(), "Loading forecast data from file")
             self.forecast = load_json(self.forecast_file)
 
@@ -312,7 +451,14 @@ class OpenWeather:
                     pass
 
             self.label = " ".join(row)
-            self.popup = self.display_popup()
+            # Dicts are only replaced when new data is decoded, so a 304 reply
+            # or an already loaded cache file reuses the previous popup
+            data = (self.weather, self.forecast, self.lang)
+            if self._popup_data is None or any(
+                new is not old for new, old in zip(data, self._popup_data)
+            ):
+                self.popup = self.display_popup()
+                self._popup_data = data
 
     @property
     def loc_label(self) -> str:
@@ -324,7 +470,7 @@ class OpenWeather:
 
     @property
     def country(self) -> str:
-        if s := get_ow_property(self.weather, calling_funcname()):
+        if s := get_ow_property(self.weather, "country"):
             return "({})".format(s)
 
     @property
@@ -333,84 +479,65 @@ class OpenWeather:
 
     @property
     def sunrise(self) -> str:
-        if s := get_ow_property(self.weather, calling_funcname()):
+        if s := get_ow_property(self.weather, "sunrise"):
             return s
 
     @property
     def sunset(self) -> str:
-        if s := get_ow_property(self.weather, calling_funcname()):
+        if s := get_ow_property(self.weather, "sunset"):
             return s
 
     @property
     def icon(self) -> str:
-        if s := get_ow_property(self.weather, calling_funcname()):
+        if s := get_ow_property(self.weather, "icon"):
             return s
 
     @property
     def desc(self) -> str:
-        if s := get_ow_property(self.weather, calling_funcname()):
+        if s := get_ow_property(self.weather, "desc"):
             return s
 
     @property
     def temp(self) -> str:
-        if s := get_ow_property(self.weather, calling_funcname()):
+        if s := get_ow_property(self.weather, "temp"):
             return "{}{}".format(
                 str(round(float(s), 1)), degrees[self.settings["units"]]
             )
 
     @property
     def feels_like(self) -> str:
-        if s := get_ow_property(self.weather, calling_funcname()):
+        if s := get_ow_property(self.weather, "feels_like"):
             return "{}: {}°".format(self.lang["feels-like"], str(round(float(s), 1)))
 
-    @property
-    def humidity(self) -> str:
-        if s := get_ow_property(self.weather, calling_funcname()):
-            return "{}: {}".format(self.lang["humidity"], s)
-
-    @property
-    def pressure(self) -> str:
-        if s := get_ow_property(self.weather, calling_funcname()):
-            return "{}: {}".format(self.lang["pressure"], s)
-
-    @property
-    def wind_speed(self) -> str:
-        if s := get_ow_property(self.weather, calling_funcname()):
-            return "{}: {}".format(self.lang["wind"], s)
-
     @property
     def wind_dir(self) -> str:
-        if s := get_ow_property(self.weather, calling_funcname()):
+        if s := get_ow_property(self.weather, "wind_dir"):
             return s
 
     @property
     def wind_gust(self) -> str:
-        if s := get_ow_property(self.weather, calling_funcname()):
+        if s := get_ow_property(self.weather, "wind_gust"):
             return "({} {})".format(self.lang["gust"], s)
 
-    @property
-    def clouds(self) -> str:
-        if s := get_ow_property(self.weather, calling_funcname()):
-            return "{}: {}".format(self.lang["cloudiness"], s)
-
-    @property
-    def visibility(self) -> str:
-        if s := get_ow_property(self.weather, calling_funcname()):
-            return "{}: {}".format(self.lang["visibility"], s)
-
     def display_popup(self):
         if (
             not self.weather
             or not self.weather["cod"] in ["200", 200]
+            or not self.forecast
             or not self.forecast["cod"] in ["200", 200]
         ):
-            print("No data available")
+            eprint("No data available")
             return
 
         rows = []
-        span = '<span font_size="{}">{}</span>'
+        # Markup tags, built once per render
+        close = "</span>"
+        open_large = '<span font_size="xx-large">'
+        open_text = f'<span font_size="{self.settings["popup-text-size"]}">'
+        cursize = self.settings["popup-forecast-size"]
+        open_small = f'<span font_size="{cursize}">'
         # Big icon
-        rows.append(span.format("xx-large", join(self.icon, self.temp)))
+        rows.append(f"{open_large}{join(self.icon, self.temp)}{close}")
         # Weather details
         for row in [
             join(self.desc, self.feels_like, sep=" - "),
@@ -419,118 +546,117 @@ class OpenWeather:
             join(self.clouds, self.visibility, sep=" - "),
         ]:
             if row:
-                rows.append(span.format(self.settings["popup-text-size"], row))
+                rows.append(f"{open_text}{row}{close}")
         # FORECAST
         if self.forecast["cod"] in [200, "200"]:
             timefmt = "%A %-e %B"
-            curday = ""
-            cursize = self.settings["popup-forecast-size"]
-            for i in range(len(self.forecast["list"])):
-                if i > 31:
-                    break
-                data = self.forecast["list"][i]
+            curday = 0
+            open_day = f'<span font_size="{cursize}" weight="bold" color="cyan">\n'
+            open_time = '<span font_size="x-small" color="orange"><tt>'
+            close_time = "</tt></span>"
+            show_humidity = self.settings["show-humidity"]
+            show_wind = self.settings["show-wind"]
+            show_pressure = self.settings["show-pressure"]
+            show_cloudiness = self.settings["show-cloudiness"]
+            show_visibility = self.settings["show-visibility"]
+            show_pop = self.settings["show-pop"]
+            show_volume = self.settings["show-volume"]
+            for data in islice(self.forecast["list"], forecast_count):
+                entry = extract_entry(
+                    data,
+                    humidity=show_humidity,
+                    wind=show_wind,
+                    pressure=show_pressure,
+                    cloudiness=show_cloudiness,
+                    visibility=show_visibility,
+                )
+                dt = datetime.fromtimestamp(data["dt"])
                 # Date
-                dt = datetime.fromtimestamp(data["dt"]).strftime(timefmt)
-                if curday != dt:
-                    curday = dt
-                    rows.append(
-                        '<span font_size="{}" weight="bold" color="cyan">\n{}</span>'.format(
-                            cursize, curday
-                        )
-                    )
+                if curday != (day := dt.toordinal()):
+                    curday = day
+                    rows.append(f"{open_day}{dt.strftime(timefmt)}{close}")
                 items = []
                 # Time
-                dt = datetime.fromtimestamp(data["dt"]).strftime("<b>%H:%M</b>")
-                items.append(
-                    '<span font_size="{}" color="orange"><tt>{}</tt></span>'.format(
-                        "x-small", dt
-                    )
-                )
+                items.append(f'{open_time}{dt.strftime("<b>%H:%M</b>")}{close_time}')
                 # Icon
-                if "weather" in data and data["weather"][0]:
-                    values = [get_ow_property(data, name) for name in ["icon", "desc"]]
-                    items.append(span.format(cursize, join(*values, sep="  ")))
+                if "icon" in entry:
+                    values = [entry["icon"], entry["desc"]]
+                    items.append(f'{open_small}{join(*values, sep="  ")}{close}')
                 # Temperature
                 values = [
-                    "{}°".format(str(int(round(value, 0))))
+                    f"{int(round(entry[name], 0))}°" if entry[name] is not None else ""
                     for name in ["temp", "feels_like"]
-                    if (value := get_ow_property(data, name))
                 ]
                 if values[1]:
-                    values[1] = "({})".format(values[1])
-                items.append(span.format(cursize, join(*values)))
+                    values[1] = f"({values[1]})"
+                items.append(f"{open_small}{join(*values)}{close}")
                 # Humidity
-                if self.settings["show-humidity"] and (
-                    value := get_ow_property(data, "humidity")
-                ):
-                    items.append(
-                        '💦 <span font_size="{}">{}%</span>'.format(cursize, value)
-                    )
+                if value := entry.get("humidity"):
+                    items.append(f"💦 {open_small}{value}{close}")
                 # Wind
-                if self.settings["show-wind"]:
+                if show_wind:
                     values = [
-                        get_ow_property(data, name)
+                        entry.get(name, "")
                         for name in ["wind_speed", "wind_dir", "wind_gust"]
                     ]
                     if values[2]:
-                        values[2] = "({})".format(values[2])
+                        values[2] = f"({values[2]})"
                     if content := join(*values):
-                        items.append(("🌬 " + span).format(cursize, content))
+                        items.append(f"🌬 {open_small}{content}{close}")
                 # Pressure
-                if self.settings["show-pressure"] and (
-                    value := get_ow_property(data, "pressure")
-                ):
-                    items.append(("🎈 " + span).format(cursize, value))
+                if value := entry.get("pressure"):
+                    items.append(f"🎈 {open_small}{value}{close}")
                 # Cloudiness
-                if self.settings["show-cloudiness"] and (
-                    value := get_ow_property(data, "clouds")
-                ):
-                    items.append(("☁ " + span).format(cursize, value))
+                if value := entry.get("clouds"):
+                    items.append(f"☁ {open_small}{value}{close}")
                 # Visibility
-                if self.settings["show-visibility"] and (
-                    value := get_ow_property(data, "visibility")
-                ):
-                    items.append(("👁 " + span).format(cursize, value))
+                if value := entry.get("visibility"):
+                    items.append(f"👁 {open_small}{value}{close}")
                 # Probability of precipitation
-                if self.settings["show-pop"] and "pop" in data and data["pop"]:
-                    items.append(
-                        '☔ <span font_size="{}">{}%</span>'.format(
-                            cursize, int(round(data["pop"] * 100, 0))
-                        )
-                    )
+                if show_pop and "pop" in data and data["pop"]:
+                    pop = int(round(data["pop"] * 100, 0))
+                    items.append(f"☔ {open_small}{pop}%{close}")
                 # Precipitation volume
-                if self.settings["show-volume"]:
+                if show_volume:
                     if "rain" in data and "3h" in data["rain"]:
-                        items.append(
-                            '📏 <span font_size="{}">{} mm</span>'.format(
-                                cursize, round(data["rain"]["3h"], 2)
-                            )
-                        )
+                        rain = round(data["rain"]["3h"], 2)
+                        items.append(f"📏 {open_small}{rain} mm{close}")
 
                     if "snow" in data and "3h" in data["snow"]:
-                        items.append(
-                            '<span font_size="{}">{} mm</span>'.format(
-                                cursize, round(data["snow"]["3h"], 2)
-                            )
-                        )
+                        snow = round(data["snow"]["3h"], 2)
+                        items.append(f"{open_small}{snow} mm{close}")
                 rows.append(" ".join(items))
-        rows.append(
-            '<span size="{}" weight="bold">\n{}</span>'.format(
-                self.settings["popup-forecast-size"],
-                join(self.loc_label, self.country, self.sunrise, self.sunset),
-            )
-        )
-        if os.path.isfile(self.forecast_file):
-            mtime = datetime.fromtimestamp(os.stat(self.forecast_file)[stat.ST_MTIME])
-            rows.append(
-                '<span font_size="{}">{}</span>'.format(
-                    self.settings["popup-forecast-size"],
-                    join(self.gps, mtime.strftime("%d %B %H:%M:%S")),
-                )
-            )
+        location = join(self.loc_label, self.country, self.sunrise, self.sunset)
+        rows.append(f'<span size="{cursize}" weight="bold">\n{location}{close}')
+        if self._forecast_stat is not None:
+            mtime = datetime.fromtimestamp(self._forecast_stat.st_mtime)
+            updated = join(self.gps, mtime.strftime("%d %B %H:%M:%S"))
+            rows.append(f"{open_small}{updated}{close}")
         return "\n".join(rows)
 
 
+def _labelled_property(name: str, label: str) -> property:
+    def getter(self) -> str:
+        if s := get_ow_property(self.weather, name):
+            return "{}: {}".format(self.lang[label], s)
+
+    return property(getter)
+
+
+def _add_labelled_properties(cls):
+    for name, label in [
+        ("humidity", "humidity"),
+        ("pressure", "pressure"),
+        ("wind_speed", "wind"),
+        ("clouds", "cloudiness"),
+        ("visibility", "visibility"),
+    ]:
+        setattr(cls, name, _labelled_property(name, label))
+
+
+_add_labelled_properties(OpenWeather)
+
+
 def main(**kwargs):
     settings = (
         {
@@ -560,18 +686,38 @@ def main(**kwargs):
             ]
         }
     )
-    voc = load_json(
-        os.path.join(
-            dir_name, "fr_FR.json" if settings["lang"] == "fr" else "en_US.json"
-        )
+    voc_file = os.path.join(
+        dir_name, "fr_FR.json" if settings["lang"] == "fr" else "en_US.json"
     )
-    executor = OpenWeather(settings, voc)
-    executor.get_data()
-    print(
-        json.dumps(
-            {"text": executor.label, "alt": executor.label, "tooltip": executor.popup}
+    executor = OpenWeather(settings, load_json_cached(voc_file))
+
+    def refresh():
+        try:
+            # Picks up edited translations without re-parsing unchanged ones
+            executor.lang = load_json_cached(voc_file)
+            executor.get_data()
+        except Exception as e:
+            # Keep the daemon alive, the next interval may succeed
+            eprint(hms(), "Refresh failed: {}".format(e))
+            return
+        print(
+            json.dumps(
+                {
+                    "text": executor.label,
+                    "alt": executor.label,
+                    "tooltip": executor.popup,
+                }
+            ),
+            flush=True,
         )
-    )
+
+    if kwargs.get("daemon", False):
+        # Keep running and print a new line every interval
+        task = create_background_task(refresh, settings["interval"])
+        task.start()
+        task.join()
+    else:
+        refresh()
 
 
 if __name__ == "__main__":
@@ -602,6 +748,11 @@ if __name__ == "__main__":
         "volume",
     ]:
         parser.add_argument(f"--show-{k}", action="store_true", help=f"Show {k}")
+    parser.add_argument(
+        "--daemon",
+        action="store_true",
+        help="Keep running and print updates every interval",
+    )
     try:
         args = parser.parse_args()
         main(**vars(args))
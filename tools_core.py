@@ -3,25 +3,20 @@
 import os
 import sys
 import json
+import functools
 import subprocess
+import tempfile
 import stat
 import time
 import threading
 
-import gi
-
-gi.require_version("GdkPixbuf", "2.0")
-gi.require_version("Gtk", "3.0")
-gi.require_version("Gdk", "3.0")
-
-from gi.repository import Gtk, Gdk, GdkPixbuf
 from shutil import copyfile
 from datetime import datetime
 
 try:
-    import psutil
-except:
-    pass
+    import orjson
+except ModuleNotFoundError:
+    orjson = None
 
 
 def eprint(*args, **kwargs):
@@ -104,22 +99,72 @@ def load_text_file(path):
         return None
 
 
+def json_loads(data):
+    """
+    Decodes JSON from str or bytes, with orjson when available
+    """
+    if orjson:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 def load_json(path):
     try:
-        with open(path, "r") as f:
-            return json.load(f)
+        with open(path, "rb") as f:
+            return json_loads(f.read())
     except Exception as e:
         eprint("Error loading json: {}".format(e))
         return {}
 
 
-def save_json(src_dict, path):
+@functools.lru_cache(maxsize=16)
+def _load_json_cached(path, mtime):
+    return load_json(path)
+
+
+def load_json_cached(path):
+    """
+    Same as load_json, but reuses the parsed dict until the file changes.
+    The dict is shared between callers and must not be modified.
+    """
     try:
-        with open(path, "w") as f:
-            json.dump(src_dict, f, indent=2)
+        mtime = os.stat(path).st_mtime_ns
+    except Exception as e:
+        eprint("Error loading json: {}".format(e))
+        return {}
+    return _load_json_cached(path, mtime)
+
+
+def save_bytes(data, path):
+    """
+    Writes data to a temporary file, then moves it over path atomically
+    """
+    try:
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path) or ".")
+    except Exception as e:
+        return e
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
         return "ok"
+    except Exception as e:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        return e
+
+
+def save_json(src_dict, path):
+    try:
+        if orjson:
+            data = orjson.dumps(src_dict)
+        else:
+            data = json.dumps(src_dict).encode("utf-8")
     except Exception as e:
         return e
+    return save_bytes(data, path)
 
 
 def save_string(string, file):
@@ -206,83 +251,6 @@ def seconds2string(seconds):
     return "{}:{}".format(hrs, minutes)
 
 
-def update_image(image, icon_name, icon_size, icons_path="", fallback=True):
-    scale = image.get_scale_factor()
-    icon_size *= scale
-    pixbuf = create_pixbuf(icon_name, icon_size, icons_path, fallback)
-    surface = Gdk.cairo_surface_create_from_pixbuf(pixbuf, scale, image.get_window())
-    image.set_from_surface(surface)
-
-
-def update_image_fallback_desktop(
-    image, icon_name, icon_size, icons_path, fallback=True
-):
-    try:
-        # This should work if your icon theme provides the icon, or if it's placed in /usr/share/pixmaps
-        update_image(image, icon_name, icon_size, fallback=False)
-    except:
-        # If the above fails, let's search .desktop files to find the icon name
-        icon_from_desktop = get_icon_name(icon_name)
-        if icon_from_desktop:
-            # trim extension, if given and the definition is not a path
-            if "/" not in icon_from_desktop:
-                icon_from_desktop = os.path.splitext(icon_from_desktop)[0]
-
-            update_image(
-                image, icon_from_desktop, icon_size, icons_path, fallback=fallback
-            )
-
-
-def update_gtk_entry(entry, icon_pos, icon_name, icon_size, icons_path=""):
-    scale = entry.get_scale_factor()
-    icon_size *= scale
-    pixbuf = create_pixbuf(icon_name, icon_size, icons_path)
-    entry.set_icon_from_pixbuf(icon_pos, pixbuf)
-
-
-def create_pixbuf(icon_name, icon_size, icons_path="", fallback=True):
-    try:
-        # In case a full path was given
-        if icon_name.startswith("/"):
-            pixbuf = GdkPixbuf.Pixbuf.new_from_file_at_size(
-                icon_name, icon_size, icon_size
-            )
-        else:
-            icon_theme = Gtk.IconTheme.get_default()
-            if icons_path:
-                search_path = icon_theme.get_search_path()
-                search_path.append(icons_path)
-                icon_theme.set_search_path(search_path)
-
-            try:
-                if icons_path:
-                    path = "{}/{}.svg".format(icons_path, icon_name)
-                    pixbuf = GdkPixbuf.Pixbuf.new_from_file_at_size(
-                        path, icon_size, icon_size
-                    )
-                else:
-                    raise ValueError("icons_path not supplied.")
-            except:
-                try:
-                    pixbuf = icon_theme.load_icon(
-                        icon_name, icon_size, Gtk.IconLookupFlags.FORCE_SIZE
-                    )
-                except:
-                    pixbuf = icon_theme.load_icon(
-                        icon_name.lower(), icon_size, Gtk.IconLookupFlags.FORCE_SIZE
-                    )
-    except Exception as e:
-        if fallback:
-            pixbuf = GdkPixbuf.Pixbuf.new_from_file_at_size(
-                os.path.join(get_config_dir(), "icons_light/icon-missing.svg"),
-                icon_size,
-                icon_size,
-            )
-        else:
-            raise e
-    return pixbuf
-
-
 def get_cache_dir():
     if os.getenv("XDG_CACHE_HOME"):
         return os.getenv("XDG_CACHE_HOME")
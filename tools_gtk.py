@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+
+import os
+
+import gi
+
+gi.require_version("GdkPixbuf", "2.0")
+gi.require_version("Gtk", "3.0")
+gi.require_version("Gdk", "3.0")
+
+from gi.repository import Gtk, Gdk, GdkPixbuf
+
+
+def update_image(image, icon_name, icon_size, icons_path="", fallback=True):
+    scale = image.get_scale_factor()
+    icon_size *= scale
+    pixbuf = create_pixbuf(icon_name, icon_size, icons_path, fallback)
+    surface = Gdk.cairo_surface_create_from_pixbuf(pixbuf, scale, image.get_window())
+    image.set_from_surface(surface)
+
+
+def update_image_fallback_desktop(
+    image, icon_name, icon_size, icons_path, fallback=True
+):
+    try:
+        # This should work if your icon theme provides the icon, or if it's placed in /usr/share/pixmaps
+        update_image(image, icon_name, icon_size, fallback=False)
+    except:
+        # If the above fails, let's search .desktop files to find the icon name
+        icon_from_desktop = get_icon_name(icon_name)
+        if icon_from_desktop:
+            # trim extension, if given and the definition is not a path
+            if "/" not in icon_from_desktop:
+                icon_from_desktop = os.path.splitext(icon_from_desktop)[0]
+
+            update_image(
+                image, icon_from_desktop, icon_size, icons_path, fallback=fallback
+            )
+
+
+def update_gtk_entry(entry, icon_pos, icon_name, icon_size, icons_path=""):
+    scale = entry.get_scale_factor()
+    icon_size *= scale
+    pixbuf = create_pixbuf(icon_name, icon_size, icons_path)
+    entry.set_icon_from_pixbuf(icon_pos, pixbuf)
+
+
+def create_pixbuf(icon_name, icon_size, icons_path="", fallback=True):
+    try:
+        # In case a full path was given
+        if icon_name.startswith("/"):
+            pixbuf = GdkPixbuf.Pixbuf.new_from_file_at_size(
+                icon_name, icon_size, icon_size
+            )
+        else:
+            icon_theme = Gtk.IconTheme.get_default()
+            if icons_path:
+                search_path = icon_theme.get_search_path()
+                search_path.append(icons_path)
+                icon_theme.set_search_path(search_path)
+
+            try:
+                if icons_path:
+                    path = "{}/{}.svg".format(icons_path, icon_name)
+                    pixbuf = GdkPixbuf.Pixbuf.new_from_file_at_size(
+                        path, icon_size, icon_size
+                    )
+                else:
+                    raise ValueError("icons_path not supplied.")
+            except:
+                try:
+                    pixbuf = icon_theme.load_icon(
+                        icon_name, icon_size, Gtk.IconLookupFlags.FORCE_SIZE
+                    )
+                except:
+                    pixbuf = icon_theme.load_icon(
+                        icon_name.lower(), icon_size, Gtk.IconLookupFlags.FORCE_SIZE
+                    )
+    except Exception as e:
+        if fallback:
+            pixbuf = GdkPixbuf.Pixbuf.new_from_file_at_size(
+                os.path.join(get_config_dir(), "icons_light/icon-missing.svg"),
+                icon_size,
+                icon_size,
+            )
+        else:
+            raise e
+    return pixbuf
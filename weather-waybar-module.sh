@@ -4,4 +4,6 @@ APPID="<Your Openweather API key>"
 LAT="<GPS latitude>"
 LON="<GPS logitude>"
 
+# Extra arguments are passed to ow-popup.py, e.g. --daemon to keep running
+# and print an update every interval instead of exiting after one
 ${0%/*}/ow-popup.py --appid $APPID --lat $LAT --lon $LON "$@"